@@ -1,14 +1,14 @@
-import re
+import math
+import time
 import streamlit as st
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable, Iterator
 import requests
-from bs4 import BeautifulSoup
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
-from langchain_community.llms import Ollama
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 from datetime import datetime
-import yfinance as yf
 
 # Streamlit configuration (must be first)
 st.set_page_config(page_title="Stock Research Agent", layout="wide")
@@ -20,129 +20,355 @@ HEADERS = {
 }
 YAHOO_FINANCE_URL = "https://finance.yahoo.com/quote/"
 
-# Initialize LLM
+# Statistics shown in the report, by category: yfinance key -> (display name, format type)
+STATS_CATEGORIES = {
+    'Valuation': {
+        'marketCap': ('Market Cap', 'currency'),
+        'enterpriseValue': ('Enterprise Value', 'currency'),
+        'trailingPE': ('P/E Ratio', 'float'),
+        'forwardPE': ('Forward P/E', 'float'),
+        'pegRatio': ('PEG Ratio', 'float'),
+        'priceToSalesTrailing12Months': ('Price/Sales', 'float'),
+        'priceToBook': ('Price/Book', 'float'),
+    },
+    'Financial': {
+        'totalRevenue': ('Revenue', 'currency'),
+        'revenuePerShare': ('Revenue/Share', 'currency'),
+        'profitMargins': ('Profit Margin', 'percentage'),
+        'operatingMargins': ('Operating Margin', 'percentage'),
+        'ebitda': ('EBITDA', 'currency'),
+        'totalDebt': ('Total Debt', 'currency'),
+        'debtToEquity': ('Debt/Equity', 'float'),
+    },
+    'Dividends': {
+        'dividendYield': ('Dividend Yield', 'percentage'),
+        'dividendRate': ('Dividend Rate', 'currency'),
+        'payoutRatio': ('Payout Ratio', 'percentage'),
+        'fiveYearAvgDividendYield': ('5Y Avg Yield', 'percentage'),
+    },
+    'Trading': {
+        'beta': ('Beta', 'float'),
+        'fiftyTwoWeekHigh': ('52W High', 'currency'),
+        'fiftyTwoWeekLow': ('52W Low', 'currency'),
+        'fiftyDayAverage': ('50D Avg', 'currency'),
+        'twoHundredDayAverage': ('200D Avg', 'currency'),
+        'volume': ('Volume', 'large_number'),
+        'averageVolume': ('Avg Volume', 'large_number'),
+        'shortRatio': ('Short Ratio', 'float'),
+    }
+}
+
+# Keys served by yfinance's fast_info: yfinance info key -> fast_info attribute. These all
+# derive from the one 1y price history fast_info fetches; market_cap is left to the full
+# info because it needs an extra shares request
+FAST_INFO_KEYS = {
+    'currentPrice': 'last_price',
+    'fiftyTwoWeekHigh': 'year_high',
+    'fiftyTwoWeekLow': 'year_low',
+    'fiftyDayAverage': 'fifty_day_average',
+    'twoHundredDayAverage': 'two_hundred_day_average',
+    'volume': 'last_volume',
+    'averageVolume': 'three_month_average_volume',
+}
+
+# Shared HTTP session so repeat lookups reuse pooled keep-alive connections
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Process-wide session (Streamlit re-executes module scope on every rerun, so it must be cached)"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    session.headers.update(HEADERS)
+    return session
+
+MAX_NEWS_ITEMS = 10
+NEWS_CHUNK_SIZE = 32 * 1024
+
+# CSS classes Yahoo Finance uses for news stream items and their source/timestamp lines
+NEWS_ITEM_CLASS = 'js-stream-content'
+NEWS_META_CLASS = 'C(#959595)'
+
+# News item fields captured in one pass over each item: tag -> (field, required CSS class)
+NEWS_FIELDS = {
+    'h3': ('headline', None),
+    'p': ('summary', None),
+    'div': ('source', NEWS_META_CLASS),
+    'span': ('timestamp', NEWS_META_CLASS),
+}
+
+class _NewsLimitReached(Exception):
+    """Raised from NewsTarget to stop parsing once enough items are collected"""
+
+class _OpenField:
+    """A news item field whose element is still open while NewsTarget streams the page"""
+    
+    def __init__(self, field: str, tag: str):
+        self.field = field
+        self.tag = tag
+        self.depth = 1
+        self.parts: List[str] = []
+
+class NewsTarget:
+    """lxml parser target that collects Yahoo Finance news items as the page streams in"""
+    
+    def __init__(self, max_items: int = MAX_NEWS_ITEMS):
+        self.max_items = max_items
+        self.items: List[Dict[str, str]] = []
+        self._item: Optional[Dict[str, str]] = None
+        self._li_depth = 0
+        # Fields currently being captured, innermost last
+        self._open: List[_OpenField] = []
+    
+    def _field_for(self, tag: str, attrib) -> Optional[str]:
+        spec = NEWS_FIELDS.get(tag)
+        if spec is None:
+            return None
+        field, css_class = spec
+        if css_class is None or css_class in attrib.get('class', '').split():
+            return field
+        return None
+    
+    def start(self, tag: str, attrib):
+        if self._item is None:
+            if tag == 'li' and NEWS_ITEM_CLASS in attrib.get('class', '').split():
+                self._item = {}
+                self._li_depth = 1
+            return
+        
+        if tag == 'li':
+            self._li_depth += 1
+        if tag == 'a' and 'link' not in self._item:
+            self._item['link'] = attrib.get('href', '')
+        
+        for open_field in self._open:
+            if open_field.tag == tag:
+                open_field.depth += 1
+        field = self._field_for(tag, attrib)
+        if field is not None and field not in self._item and all(f.field != field for f in self._open):
+            self._open.append(_OpenField(field, tag))
+    
+    def data(self, text: str):
+        for open_field in self._open:
+            open_field.parts.append(text)
+    
+    def end(self, tag: str):
+        if self._item is None:
+            return
+        
+        closed = False
+        for open_field in self._open:
+            if open_field.tag == tag:
+                open_field.depth -= 1
+                if open_field.depth == 0:
+                    self._item[open_field.field] = "".join(open_field.parts).strip()
+                    closed = True
+        if closed:
+            self._open = [f for f in self._open if f.depth]
+        
+        if tag == 'li':
+            self._li_depth -= 1
+            if self._li_depth == 0:
+                self._finish_item()
+    
+    def _finish_item(self):
+        item, self._item = self._item, None
+        self._open = []
+        # Only a headline is required; items missing a source or timestamp are kept with
+        # empty fields (the old BeautifulSoup scraper dropped them)
+        headline = item.get('headline', '')
+        if headline:
+            link = item.get('link', '').strip() or "#"
+            self.items.append({
+                'headline': headline,
+                'source': item.get('source', ''),
+                'timestamp': item.get('timestamp', ''),
+                'summary': item.get('summary', ''),
+                'link': f"https://finance.yahoo.com{link}" if not link.startswith('http') else link
+            })
+        if len(self.items) >= self.max_items:
+            raise _NewsLimitReached()
+    
+    def close(self) -> List[Dict[str, str]]:
+        return self.items
+
+def scrape_news(url: str) -> List[Dict[str, str]]:
+    """Stream the quote page and extract news items without building a full DOM"""
+    target = NewsTarget()
+    with get_session().get(url, timeout=TIMEOUT, stream=True) as resp:
+        resp.raise_for_status()
+        # Decode with the Content-Type charset like resp.text did; without one, lxml
+        # falls back to <meta charset>/BOM detection
+        try:
+            parser = etree.HTMLParser(target=target, encoding=resp.encoding)
+        except LookupError:
+            parser = etree.HTMLParser(target=target)
+        try:
+            for chunk in resp.iter_content(chunk_size=NEWS_CHUNK_SIZE):
+                parser.feed(chunk)
+            return parser.close()
+        except _NewsLimitReached:
+            # Stopping early leaves the body unread, so closing the response drops this
+            # connection instead of returning it to the pool; skipping the rest of the
+            # multi-MB page is worth more than reusing the connection
+            return target.items
+
+# Analysis prompt (the LLM and chain are built lazily by load_chain)
+STOCK_TEMPLATE = """
+    Analyze {ticker} ({company_name}) stock with the following data:
+    
+    **Current Price:** {price}
+    
+    **Key Statistics:**
+    {stats}
+    
+    **Recent News Highlights:**
+    {news}
+    
+    Provide a comprehensive report with:
+    1. **Company Overview**: Business model and industry position
+    2. **Financial Health**: Analysis of key metrics and ratios
+    3. **Valuation Assessment**: Fair value estimate and comparison
+    4. **Recent Developments**: News impact analysis
+    5. **Investment Thesis**: Conviction level and time horizon
+    6. **Recommendation**: Buy/Hold/Sell with price targets
+    7. **Risk Factors**: Key risks to the investment thesis
+    """
+
+# Initialize LLM (LangChain is imported on first use to keep app start-up fast)
 @st.cache_resource
 def load_llm():
+    from langchain_community.llms import Ollama
     return Ollama(model="llama3", temperature=0.2)
 
-llm = load_llm()
+@st.cache_resource
+def load_chain():
+    from langchain.prompts import PromptTemplate
+    prompt = PromptTemplate(
+        template=STOCK_TEMPLATE,
+        input_variables=["ticker", "company_name", "price", "stats", "news"]
+    )
+    # Runnable pipeline so the analysis can be streamed token by token
+    return prompt | load_llm()
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Shared pool for background work started while a report renders"""
+    return ThreadPoolExecutor(max_workers=8)
 
 def clean_text(text: str) -> str:
     """Clean and normalize scraped text"""
-    return re.sub(r'\s+', ' ', text).strip()
+    return ' '.join(text.split())
+
+def _stat_formatter(fmt: Callable[[float], str]) -> Callable[[Any], str]:
+    """Wrap a numeric formatter with the shared missing/non-numeric handling"""
+    def formatter(value: Any) -> str:
+        if value is None:
+            return "N/A"
+        if isinstance(value, (int, float)):
+            return fmt(value)
+        return str(value)
+    return formatter
+
+_LARGE_NUMBER_SCALES = ((1, ""), (1e3, "K"), (1e6, "M"), (1e9, "B"))
+
+def _large_number(value: float) -> str:
+    if not math.isfinite(value):
+        return f"{value:,.2f}"
+    # Thousands groups in the integer part pick the suffix, capped at billions
+    scale, suffix = _LARGE_NUMBER_SCALES[min(3, (len(str(int(abs(value)))) - 1) // 3)]
+    return f"{value/scale:,.2f}{suffix}"
+
+_fmt_currency = _stat_formatter(lambda value: f"${value:,.2f}")
+_fmt_percentage = _stat_formatter(lambda value: f"{value:.2%}")
+_fmt_large_number = _stat_formatter(_large_number)
+_fmt_float = _stat_formatter(lambda value: f"{value:,.2f}")
+
+FORMATTERS_BY_TYPE = {
+    'currency': _fmt_currency,
+    'percentage': _fmt_percentage,
+    'large_number': _fmt_large_number,
+    'float': _fmt_float,
+}
 
 def format_stat_value(value: Any, stat_type: str) -> str:
     """Format different types of statistics for display"""
-    if value is None:
-        return "N/A"
-    
-    if isinstance(value, (int, float)):
-        if stat_type == 'currency':
-            return f"${value:,.2f}"
-        elif stat_type == 'percentage':
-            return f"{value:.2%}"
-        elif stat_type == 'large_number':
-            if abs(value) >= 1e9:
-                return f"{value/1e9:,.2f}B"
-            elif abs(value) >= 1e6:
-                return f"{value/1e6:,.2f}M"
-            elif abs(value) >= 1e3:
-                return f"{value/1e3:,.2f}K"
-        return f"{value:,.2f}"
-    return str(value)
+    return FORMATTERS_BY_TYPE.get(stat_type, _fmt_float)(value)
+
+# Flattened (category, yfinance key, display name, formatter) rows for STATS_CATEGORIES
+FORMATTERS = tuple(
+    (category, yf_key, display_name, FORMATTERS_BY_TYPE.get(fmt_type, _fmt_float))
+    for category, stats in STATS_CATEGORIES.items()
+    for yf_key, (display_name, fmt_type) in stats.items()
+)
+
+def format_stats(values: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Format raw yfinance values into the categorised statistics shown in the report"""
+    formatted_stats = {category: {} for category in STATS_CATEGORIES}
+    for category, yf_key, display_name, formatter in FORMATTERS:
+        value = formatter(values.get(yf_key))
+        if value != "N/A":
+            formatted_stats[category][display_name] = value
+    return formatted_stats
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_fast_info(ticker: str) -> Dict[str, Any]:
+    """Fetch the price and trading figures available from yfinance's fast_info"""
+    import yfinance as yf
+    fast_info = yf.Ticker(ticker).fast_info
+    values = {}
+    for yf_key, attr in FAST_INFO_KEYS.items():
+        # Only per-field gaps are skipped; request errors propagate so they are not cached
+        try:
+            value = float(getattr(fast_info, attr))
+        except (KeyError, TypeError, ValueError):
+            continue
+        if not math.isnan(value):
+            values[yf_key] = value
+    if not values:
+        raise ValueError(f"no market data found for {ticker}")
+    return values
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_info(ticker: str) -> Dict[str, Any]:
+    """Fetch the slow-moving company profile and statistics from yfinance"""
+    import yfinance as yf
+    return yf.Ticker(ticker).info
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_news(ticker: str) -> List[Dict[str, str]]:
+    """Scrape the latest news items for a ticker"""
+    return scrape_news(f"{YAHOO_FINANCE_URL}{ticker}")
 
 def fetch_stock_data(ticker: str) -> Optional[Dict[str, Any]]:
     """Enhanced data fetcher using yfinance and web scraping"""
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
+    url = f"{YAHOO_FINANCE_URL}{ticker}"
+    
     try:
-        # Get all available data from yfinance
-        yf_ticker = yf.Ticker(ticker)
-        info = yf_ticker.info
-        history = yf_ticker.history(period="1d")
+        # Fire the quick yfinance lookup and the news scrape concurrently (both I/O bound);
+        # the heavy info blob is started by main and finished in display_stock_report
+        # (shared pool, so a stalled request cannot hold the page past its timeout)
+        executor = get_executor()
+        deadline = time.monotonic() + TIMEOUT + 2
+        fast_future = executor.submit(_fetch_fast_info, ticker)
+        news_future = executor.submit(_fetch_news, ticker)
         
-        # Get current price from most recent trading data
-        current_price = history['Close'].iloc[-1] if not history.empty else info.get('currentPrice')
-        
-        # Scrape news with details from Yahoo Finance
-        url = f"{YAHOO_FINANCE_URL}{ticker}"
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'lxml')
-        
-        # Extract detailed news items with metadata
-        detailed_news = []
-        news_items = soup.find_all('li', {'class': 'js-stream-content'})[:10]
-        for item in news_items:
-            try:
-                headline = item.find('h3').text.strip()
-                source = item.find('div', {'class': 'C(#959595)'}).text.strip()
-                timestamp = item.find('span', {'class': 'C(#959595)'}).text.strip()
-                summary = item.find('p').text.strip() if item.find('p') else ""
-                link = item.find('a')['href'] if item.find('a') else "#"
-                
-                detailed_news.append({
-                    'headline': headline,
-                    'source': source,
-                    'timestamp': timestamp,
-                    'summary': summary,
-                    'link': f"https://finance.yahoo.com{link}" if not link.startswith('http') else link
-                })
-            except Exception as e:
-                continue
-        
-        # Organize all available statistics into categories
-        stats_categories = {
-            'Valuation': {
-                'marketCap': ('Market Cap', 'currency'),
-                'enterpriseValue': ('Enterprise Value', 'currency'),
-                'trailingPE': ('P/E Ratio', 'float'),
-                'forwardPE': ('Forward P/E', 'float'),
-                'pegRatio': ('PEG Ratio', 'float'),
-                'priceToSalesTrailing12Months': ('Price/Sales', 'float'),
-                'priceToBook': ('Price/Book', 'float'),
-            },
-            'Financial': {
-                'totalRevenue': ('Revenue', 'currency'),
-                'revenuePerShare': ('Revenue/Share', 'currency'),
-                'profitMargins': ('Profit Margin', 'percentage'),
-                'operatingMargins': ('Operating Margin', 'percentage'),
-                'ebitda': ('EBITDA', 'currency'),
-                'totalDebt': ('Total Debt', 'currency'),
-                'debtToEquity': ('Debt/Equity', 'float'),
-            },
-            'Dividends': {
-                'dividendYield': ('Dividend Yield', 'percentage'),
-                'dividendRate': ('Dividend Rate', 'currency'),
-                'payoutRatio': ('Payout Ratio', 'percentage'),
-                'fiveYearAvgDividendYield': ('5Y Avg Yield', 'percentage'),
-            },
-            'Trading': {
-                'beta': ('Beta', 'float'),
-                'fiftyTwoWeekHigh': ('52W High', 'currency'),
-                'fiftyTwoWeekLow': ('52W Low', 'currency'),
-                'fiftyDayAverage': ('50D Avg', 'currency'),
-                'twoHundredDayAverage': ('200D Avg', 'currency'),
-                'volume': ('Volume', 'large_number'),
-                'averageVolume': ('Avg Volume', 'large_number'),
-                'shortRatio': ('Short Ratio', 'float'),
-            }
-        }
-        
-        # Build formatted statistics dictionary
-        formatted_stats = {}
-        for category, stats in stats_categories.items():
-            category_stats = {}
-            for yf_key, (display_name, fmt_type) in stats.items():
-                value = info.get(yf_key)
-                category_stats[display_name] = format_stat_value(value, fmt_type)
-            formatted_stats[category] = {k: v for k, v in category_stats.items() if v != "N/A"}
+        fast_values = fast_future.result(timeout=TIMEOUT + 2)
+        try:
+            detailed_news = news_future.result(timeout=max(0, deadline - time.monotonic()))
+        except (FuturesTimeoutError, requests.RequestException, etree.LxmlError):
+            detailed_news = []
         
         return {
-            'company_name': info.get('shortName', ticker),
+            'company_name': ticker,
             'ticker': ticker,
-            'current_price': format_stat_value(current_price, 'currency'),
-            'stats': formatted_stats,
+            'current_price': format_stat_value(fast_values.get('currentPrice'), 'currency'),
+            'stats': format_stats(fast_values),
+            'fast_values': fast_values,
             'news': detailed_news if detailed_news else [{
                 'headline': 'No recent news available',
                 'source': '',
@@ -153,18 +379,36 @@ def fetch_stock_data(ticker: str) -> Optional[Dict[str, Any]]:
             'last_updated': current_time,
             'url': url
         }
+    except FuturesTimeoutError:
+        st.error(f"Failed to fetch data for {ticker}: timed out after {TIMEOUT + 2}s")
+        return None
     except Exception as e:
         st.error(f"Failed to fetch data for {ticker}: {str(e)}")
         return None
 
-def display_stock_report(stock_data: Dict[str, Any]):
+def load_detailed_stats(stock_data: Dict[str, Any], info: Dict[str, Any]):
+    """Fill in the company name and remaining statistics from the full yfinance info"""
+    stock_data['company_name'] = info.get('shortName', stock_data['ticker'])
+    if 'currentPrice' not in stock_data['fast_values']:
+        stock_data['current_price'] = format_stat_value(info.get('currentPrice'), 'currency')
+    stock_data['stats'] = format_stats({**info, **stock_data['fast_values']})
+
+def render_stats(placeholders: List[Any], stats: Dict[str, Dict[str, str]]):
+    """Render each statistics category into its tab placeholder"""
+    for placeholder, category_stats in zip(placeholders, stats.values()):
+        with placeholder.container():
+            for stat, value in category_stats.items():
+                st.markdown(f"**{stat}:** `{value}`")
+
+def display_stock_report(stock_data: Dict[str, Any], info_future: Future):
     """Enhanced display with detailed statistics and news"""
-    st.subheader(f"{stock_data['company_name']} ({stock_data['ticker']})")
+    header = st.empty()
+    header.subheader(f"{stock_data['company_name']} ({stock_data['ticker']})")
     
     # Price and update time
     col1, col2 = st.columns([2, 4])
-    with col1:
-        st.metric("Current Price", stock_data['current_price'])
+    price_metric = col1.empty()
+    price_metric.metric("Current Price", stock_data['current_price'])
     with col2:
         st.caption(f"Last updated: {stock_data['last_updated']}")
     
@@ -172,10 +416,8 @@ def display_stock_report(stock_data: Dict[str, Any]):
     st.subheader("📊 Detailed Statistics")
     stats_tabs = st.tabs(list(stock_data['stats'].keys()))
     
-    for tab, (category, stats) in zip(stats_tabs, stock_data['stats'].items()):
-        with tab:
-            for stat, value in stats.items():
-                st.markdown(f"**{stat}:** `{value}`")
+    stats_placeholders = [tab.empty() for tab in stats_tabs]
+    render_stats(stats_placeholders, stock_data['stats'])
     
     # Enhanced News Section
     st.subheader("📰 Recent News")
@@ -187,40 +429,37 @@ def display_stock_report(stock_data: Dict[str, Any]):
                 st.write(news_item['summary'])
             st.markdown(f"[Read more]({news_item['link']})", unsafe_allow_html=True)
     
+    # Complete the statistics once the slower full info lookup returns
+    with st.spinner("Loading detailed statistics..."):
+        try:
+            load_detailed_stats(stock_data, info_future.result(timeout=TIMEOUT + 2))
+        except FuturesTimeoutError:
+            st.warning(f"Detailed statistics unavailable: timed out after {TIMEOUT + 2}s")
+        except Exception as e:
+            st.warning(f"Detailed statistics unavailable: {str(e)}")
+        else:
+            header.subheader(f"{stock_data['company_name']} ({stock_data['ticker']})")
+            price_metric.metric("Current Price", stock_data['current_price'])
+            render_stats(stats_placeholders, stock_data['stats'])
+    
     # AI Analysis
     st.subheader("🤖 AI Analysis & Recommendation")
+    analysis_inputs = build_analysis_inputs(stock_data)
+    memo = _analysis_memo(*analysis_inputs)
     with st.spinner("Generating analysis..."):
-        analysis = generate_stock_analysis(stock_data)
-        st.markdown(analysis)
+        if 'analysis' in memo:
+            st.markdown(memo['analysis'])
+        else:
+            memo['analysis'] = st.write_stream(generate_stock_analysis(*analysis_inputs))
 
-def generate_stock_analysis(stock_data: Dict[str, Any]) -> str:
-    """Generate detailed AI analysis of the stock"""
-    template = """
-    Analyze {ticker} ({company_name}) stock with the following data:
-    
-    **Current Price:** {price}
-    
-    **Key Statistics:**
-    {stats}
-    
-    **Recent News Highlights:**
-    {news}
-    
-    Provide a comprehensive report with:
-    1. **Company Overview**: Business model and industry position
-    2. **Financial Health**: Analysis of key metrics and ratios
-    3. **Valuation Assessment**: Fair value estimate and comparison
-    4. **Recent Developments**: News impact analysis
-    5. **Investment Thesis**: Conviction level and time horizon
-    6. **Recommendation**: Buy/Hold/Sell with price targets
-    7. **Risk Factors**: Key risks to the investment thesis
-    """
-    
+def build_analysis_inputs(stock_data: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
+    """Flatten stock data into the plain strings the analysis prompt needs"""
     # Format statistics for the prompt
-    stats_str = ""
+    stats_parts = []
     for category, stats in stock_data['stats'].items():
-        stats_str += f"\n**{category}**\n"
-        stats_str += "\n".join([f"- {k}: {v}" for k, v in stats.items()])
+        stats_parts.append(f"\n**{category}**\n")
+        stats_parts.append("\n".join([f"- {k}: {v}" for k, v in stats.items()]))
+    stats_str = "".join(stats_parts)
     
     # Format news for the prompt
     news_str = "\n".join([
@@ -228,16 +467,25 @@ def generate_stock_analysis(stock_data: Dict[str, Any]) -> str:
         for item in stock_data['news']
     ])
     
-    prompt = PromptTemplate(
-        template=template,
-        input_variables=["ticker", "company_name", "price", "stats", "news"]
+    return (
+        stock_data['ticker'],
+        stock_data['company_name'],
+        stock_data['current_price'],
+        stats_str,
+        news_str
     )
-    
-    chain = LLMChain(llm=llm, prompt=prompt)
-    return chain.run({
-        "ticker": stock_data['ticker'],
-        "company_name": stock_data['company_name'],
-        "price": stock_data['current_price'],
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def _analysis_memo(ticker: str, company_name: str, price: str, stats_str: str, news_str: str) -> Dict[str, str]:
+    """Shared slot for a finished analysis, so repeat reports skip the LLM"""
+    return {}
+
+def generate_stock_analysis(ticker: str, company_name: str, price: str, stats_str: str, news_str: str) -> Iterator[str]:
+    """Stream detailed AI analysis of the stock as it is generated"""
+    return load_chain().stream({
+        "ticker": ticker,
+        "company_name": company_name,
+        "price": price,
         "stats": stats_str,
         "news": news_str
     })
@@ -256,11 +504,16 @@ def main():
     ).strip().upper()
     
     if st.button("Get Detailed Report", type="primary") and ticker:
+        # Start the slow full info lookup and LLM set-up alongside the quick fetch
+        executor = get_executor()
+        info_future = executor.submit(_fetch_info, ticker)
+        executor.submit(load_chain)
+        
         with st.spinner(f"Fetching comprehensive data for {ticker}..."):
             stock_data = fetch_stock_data(ticker)
         
         if stock_data:
-            display_stock_report(stock_data)
+            display_stock_report(stock_data, info_future)
         else:
             st.error(f"Could not fetch data for {ticker}. Please try again.")
 